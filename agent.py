@@ -1,37 +1,125 @@
+import json
+
 import ollama
+
 from ollama_toolmanager import OllamaToolManager
 
+# num_ctx values the agent is allowed to request. Ollama reloads the model
+# whenever num_ctx changes, so we only move between a few fixed sizes.
+CONTEXT_BUCKETS = (2048, 4096, 8192, 16384, 32768)
+# Rough characters-per-token ratio used to estimate prompt size without a tokenizer.
+CHARS_PER_TOKEN = 4
+# Tokens kept free for the model's reply on top of the prompt.
+RESPONSE_RESERVE = 512
+# Read-only tools worth calling speculatively while the model is thinking.
+PREFETCH_TOOLS = ("git_status", "git_log")
+
 class OllamaAgent:
     def __init__(self,model:str,
                  tool_manager: OllamaToolManager,
                  repo_path: str,
-                 default_prompt="You are a helpful assistant who can use available tools to solve problems") -> None:
+                 default_prompt="You are a helpful assistant who can use available tools to solve problems",
+                 context_buckets=CONTEXT_BUCKETS,
+                 prefetch_tools=(),
+                 prefetch_ttl: float = 30.0) -> None:
         self.model = model
         self.default_prompt = default_prompt
         self.messages = []
         self.repo_path = repo_path
         self.tool_manager = tool_manager
+        self.context_buckets = sorted(context_buckets)
+        self.num_ctx = None
+        self.client = ollama.AsyncClient()
+        self.prefetch_tools = tuple(prefetch_tools)
+        self.prefetch_ttl = prefetch_ttl
+
+    def estimate_tokens(self, messages, tools) -> int:
+        """
+        Estimate the prompt token count for the given messages and tools.
+        """
+        payload = json.dumps(messages, default=str) + json.dumps(tools, default=str)
+        return len(payload) // CHARS_PER_TOKEN + 1
+
+    def select_num_ctx(self, prompt_tokens: int) -> tuple[int, bool]:
+        """
+        Pick the smallest context bucket that fits the prompt plus a reply.
+        The window never shrinks within a session so the model is not reloaded
+        back and forth between sizes. Also returns whether the prompt is too
+        big for the largest bucket and will be truncated.
+        """
+        needed = prompt_tokens + RESPONSE_RESERVE
+        num_ctx = self.context_buckets[-1]
+        for bucket in self.context_buckets:
+            if bucket >= needed:
+                num_ctx = bucket
+                break
+        truncated = needed > num_ctx
+        if self.num_ctx is not None:
+            num_ctx = max(num_ctx, self.num_ctx)
+        self.num_ctx = num_ctx
+        return num_ctx, truncated
 
-    async def get_response(self, content:str):
-        self.messages.append({
+    def prefetch_candidates(self):
+        """
+        Tool calls to start speculatively: every prefetch tool with just the
+        repo path, plus recent calls to prefetch tools with their arguments.
+        """
+        candidates = [(name, {'repo_path': self.repo_path}) for name in self.prefetch_tools]
+        for name, arguments in reversed(self.tool_manager.recent_calls):
+            if name in self.prefetch_tools and (name, arguments) not in candidates:
+                candidates.append((name, arguments))
+        return candidates
+
+    def prefetch(self):
+        """Start the candidate tool calls in the background"""
+        for name, arguments in self.prefetch_candidates():
+            self.tool_manager.prefetch(name, arguments, self.prefetch_ttl)
+
+    async def get_response(self, content:str, messages=None, on_warning=None):
+        """
+        Send a prompt to the model. Pass a separate `messages` list to keep
+        the exchange out of the shared history, e.g. for concurrent requests.
+        `on_warning` is called with a message before the request is sent if
+        the prompt will be truncated; it defaults to print.
+        """
+        if messages is None:
+            messages = self.messages
+        messages.append({
             'role':'user',
             'content' : content
         })
 
-        query = ollama.chat(
+        tools = self.tool_manager.get_tools()
+        prompt_tokens = self.estimate_tokens(messages, tools)
+        num_ctx, truncated = self.select_num_ctx(prompt_tokens)
+        if truncated:
+            (on_warning or print)(
+                f"Warning: prompt needs ~{prompt_tokens + RESPONSE_RESERVE} tokens but the "
+                f"context window is capped at {num_ctx}; older messages may be truncated."
+            )
+
+        if self.prefetch_tools:
+            self.prefetch()
+
+        # The async client lets other requests and prefetched tool calls make
+        # progress meanwhile, and lets a cancelled job abort its request.
+        query = await self.client.chat(
             model=self.model,
-            messages=self.messages,
-            tools=self.tool_manager.get_tools()
+            messages=messages,
+            tools=tools,
+            options={'num_ctx': num_ctx}
         )
 
-        result = await self.handle_response(query)
+        result = await self.handle_response(query, messages)
         return result
 
-    async def handle_response(self, response):
+    async def handle_response(self, response, messages=None):
+        if messages is None:
+            messages = self.messages
         try:
 
             tool_calls = response.message.tool_calls
-            self.messages.append({
+            messages.append({
                 'role' : 'tool',
                 'content' : str(response)
             })
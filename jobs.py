@@ -0,0 +1,107 @@
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class Job:
+    id: int
+    prompt: str
+    status: str = "queued"
+    result: Any = None
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+
+class JobManager:
+    def __init__(self, agent, max_concurrent: int = 2, max_active: int = 8,
+                 on_complete: Callable[[Job], None] | None = None,
+                 on_warning: Callable[[Job, str], None] | None = None):
+        self.agent = agent
+        self.max_active = max_active
+        self.on_complete = on_complete
+        self.on_warning = on_warning
+        self.jobs: dict[int, Job] = {}
+        self._next_id = 1
+        self._slots = asyncio.Semaphore(max_concurrent)
+
+    def submit(self, prompt: str) -> Job:
+        """
+        Queue a prompt as a background job and return it immediately.
+        """
+        if len(self.active()) >= self.max_active:
+            raise RuntimeError(f"Too many jobs in flight ({self.max_active} queued or running)")
+        job = Job(self._next_id, prompt)
+        self._next_id += 1
+        job.task = asyncio.create_task(self._run(job))
+        job.task.add_done_callback(lambda task: self._finished(job, task))
+        self.jobs[job.id] = job
+        return job
+
+    def _finished(self, job: Job, task: asyncio.Task):
+        # A job cancelled before its first step never enters _run, so take
+        # the final status from the task itself.
+        if task.cancelled():
+            job.status = "cancelled"
+
+    async def _run(self, job: Job):
+        try:
+            async with self._slots:
+                job.status = "running"
+                # Work on a snapshot of the conversation so concurrent jobs
+                # don't interleave their messages, then merge the exchange
+                # back so later prompts can refer to it.
+                history = list(self.agent.messages)
+                seeded = len(history)
+                on_warning = None
+                if self.on_warning:
+                    def on_warning(message):
+                        self.on_warning(job, message)
+                job.result = await self.agent.get_response(job.prompt, messages=history,
+                                                           on_warning=on_warning)
+                self.agent.messages.extend(history[seeded:])
+            job.status = "done"
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+            raise
+        except Exception as e:
+            job.status = "failed"
+            job.result = f"Error occurred: {e}"
+        if self.on_complete:
+            self.on_complete(job)
+        return job.result
+
+    def active(self) -> list[Job]:
+        """Jobs that are queued or running"""
+        return [job for job in self.jobs.values() if not job.task.done()]
+
+    def all(self) -> list[Job]:
+        """All jobs submitted in this session"""
+        return list(self.jobs.values())
+
+    def cancel(self, job_id: int) -> bool:
+        """Cancel a queued or running job"""
+        job = self.jobs.get(job_id)
+        if job is None or job.task.done():
+            return False
+        job.task.cancel()
+        return True
+
+    async def wait(self, job_id: int) -> Any:
+        """Wait for a job to finish and return its result"""
+        job = self.jobs.get(job_id)
+        if job is None:
+            raise ValueError(f"Unknown job: {job_id}")
+        try:
+            await asyncio.shield(job.task)
+        except asyncio.CancelledError:
+            if not job.task.cancelled():
+                raise
+        return job.result
+
+    async def shutdown(self):
+        """Cancel outstanding jobs and wait for them to unwind"""
+        tasks = [job.task for job in self.active()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
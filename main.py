@@ -1,9 +1,11 @@
 import asyncio
+import threading
 import ollama
 # from mcp import StdioServerParameters # Moved into main()
 from mcpclient import MCPClient
 from ollama_toolmanager import OllamaToolManager
-from agent import OllamaAgent
+from agent import OllamaAgent, PREFETCH_TOOLS
+from jobs import Job, JobManager
 
 from rich.console import Console
 from rich.panel import Panel
@@ -52,7 +54,7 @@ def select_model_and_initialize_agent(console: Console):
 
     # Initialize OllamaToolManager here or pass as an argument if it's complex/shared
     tool_manager = OllamaToolManager()
-    agent = OllamaAgent(selected_model_name, tool_manager, repo_path)
+    agent = OllamaAgent(selected_model_name, tool_manager, repo_path, prefetch_tools=PREFETCH_TOOLS)
 
     git_server_params = StdioServerParameters(
         command="uvx",
@@ -84,25 +86,118 @@ async def main():
                 inputSchema=tool.inputSchema
             )
 
-        while True:
-            try:
-                print("-" * 40)
-                user_prompt = input("How can I help you?\n")
-                print("-" * 40)
-                if user_prompt.lower() in ['quit', 'exit', 'q']:
+        def print_warning(job, message):
+            console.print(f"[bold yellow]Job {job.id}:[/bold yellow] {message}")
+
+        jobs = JobManager(agent, on_complete=lambda job: print_job_result(console, job), on_warning=print_warning)
+        console.print("Prompts run in the background. Commands: /jobs, /wait <id>, /cancel <id>, /stats, quit")
+
+        try:
+            while True:
+                try:
+                    print("-" * 40)
+                    user_prompt = (await read_input("How can I help you?\n")).strip()
+                    print("-" * 40)
+                    if user_prompt.lower() in ['quit', 'exit', 'q']:
+                        break
+                    if not user_prompt:
+                        continue
+                    await handle_command(console, jobs, user_prompt)
+
+                except EOFError:
                     break
-                print()
-                with console.status("[bold green]Finding the right tool for the job...[/bold green]", spinner="dots"):
-                    res = await agent.get_response(user_prompt)
-                    console.print("\n[bold magenta]Result:[/bold magenta]")
-                    console.print(Panel.fit(res, style="green"))
-
-            except KeyboardInterrupt:
-                print("\nExiting...")
-                break
-            except Exception as e:
-                print(f"\nError occurred: {e}")
+                except Exception as e:
+                    print(f"\nError occurred: {e}")
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            # asyncio.run turns Ctrl-C into a cancellation of this task.
+            asyncio.current_task().uncancel()
+        finally:
+            print("\nExiting...")
+            await jobs.shutdown()
+            agent.tool_manager.invalidate_prefetch()
+            console.print(str(agent.tool_manager.prefetch_stats))
+
+
+async def read_input(prompt: str) -> str:
+    """
+    Read a line from stdin without blocking the event loop. The reader runs
+    in a daemon thread so a pending input() never holds up exit.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def deliver(result, error):
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def reader():
+        result, error = None, None
+        try:
+            result = input(prompt)
+        except (EOFError, KeyboardInterrupt) as e:
+            error = e
+        try:
+            loop.call_soon_threadsafe(deliver, result, error)
+        except RuntimeError:
+            pass  # The loop has already closed
+
+    threading.Thread(target=reader, daemon=True).start()
+    return await future
+
+def print_job_result(console: Console, job: Job):
+    """
+    Print a finished job's status and, unless it was cancelled, its result.
+    """
+    console.print(f"\n[bold magenta]Result of job {job.id} ({job.status}):[/bold magenta] {job.prompt}")
+    if job.status != "cancelled":
+        console.print(Panel.fit(str(job.result), style="green" if job.status == "done" else "red"))
 
 
+async def handle_command(console: Console, jobs: JobManager, user_prompt: str):
+    """
+    Run a REPL job command, or submit the input as a new background job.
+    """
+    command, _, arg = user_prompt.partition(" ")
+    if command == "/stats":
+        console.print(str(jobs.agent.tool_manager.prefetch_stats))
+    elif command == "/jobs":
+        for job in jobs.all():
+            console.print(f"[{job.id}] {job.status:<9} {job.prompt}")
+        if not jobs.all():
+            console.print("No jobs submitted yet.")
+    elif command in ("/wait", "/cancel"):
+        if not arg.strip().isdigit():
+            console.print(f"[prompt.invalid]Usage: {command} <job id>")
+            return
+        job_id = int(arg)
+        job = jobs.jobs.get(job_id)
+        if job is None:
+            console.print(f"[prompt.invalid]Unknown job: {job_id}")
+        elif command == "/cancel":
+            if jobs.cancel(job_id):
+                console.print(f"Cancelled job {job_id}.")
+            else:
+                console.print(f"[prompt.invalid]Job {job_id} is not running.")
+        else:
+            finished = job.task.done()
+            if not finished:
+                with console.status(f"[bold green]Waiting for job {job_id}...[/bold green]", spinner="dots"):
+                    await jobs.wait(job_id)
+            # Jobs that complete while we wait are printed by on_complete;
+            # show the rest here so /wait always reports something.
+            if finished or job.status == "cancelled":
+                print_job_result(console, job)
+    else:
+        try:
+            job = jobs.submit(user_prompt)
+        except RuntimeError as e:
+            console.print(f"[prompt.invalid]{e}. Wait for a job to finish or cancel one.")
+            return
+        console.print(f"Submitted job {job.id}.")
+
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,3 +1,7 @@
+import asyncio
+import json
+import time
+from collections import deque
 from typing import Any, Dict, List, Callable
 from dataclasses import dataclass
 
@@ -10,9 +14,31 @@ class OllamaTool:
     required: list[str]
 
 
+@dataclass
+class PrefetchStats:
+    issued: int = 0
+    hits: int = 0
+    wasted: int = 0
+    invalidated: int = 0
+
+    def __str__(self) -> str:
+        rate = self.hits / self.issued if self.issued else 0.0
+        return (f"prefetch: {self.issued} issued, {self.hits} hits ({rate:.0%}), "
+                f"{self.wasted} wasted, {self.invalidated} invalidated")
+
+
 class OllamaToolManager:
-    def __init__(self):
+    def __init__(self, history_size: int = 10):
         self.tools = {}
+        self.recent_calls = deque(maxlen=history_size)
+        self.prefetch_cache = {}
+        self.prefetchable = set()
+        self.prefetch_stats = PrefetchStats()
+
+    @staticmethod
+    def call_key(name: str, arguments: dict[str, Any]) -> tuple:
+        """Cache key for a tool call, independent of argument order"""
+        return (name, json.dumps(arguments, sort_keys=True, default=str))
 
     def register_tool(self, name: str, function:Callable, description: str, inputSchema: Dict[str, Any]):
         """
@@ -55,7 +81,12 @@ class OllamaToolManager:
             tool_input.update({'repo_path' : repo_path})
         if name not in self.tools:
             raise ValueError(f"Unknown tool: {name}")
+        self.recent_calls.append((name, dict(tool_input)))
         try:
+            prefetched = self._take_prefetched(name, tool_input)
+            if prefetched is not None:
+                print("\nTool (prefetched) = \n", name)
+                return await prefetched
             tool_func = self.tools[name].function
             print("\nTool = \n", name)
             print("\nTool input = \n", tool_input)
@@ -69,7 +100,66 @@ class OllamaToolManager:
                 }],
                 'status': 'error'
             }
+        finally:
+            # Anything that isn't a prefetch tool may have changed the repo,
+            # so parked results can no longer be trusted.
+            if name not in self.prefetchable:
+                self.invalidate_prefetch()
+
+    def prefetch(self, name: str, arguments: dict[str, Any], ttl: float = 30.0) -> bool:
+        """
+        Speculatively start a tool call and park the result for `ttl` seconds.
+        Only use this for read-only tools: any tool that was never prefetched
+        is treated as a write and drops the whole cache when it runs. An
+        existing entry for the same call is replaced so each turn starts from
+        fresh data. Returns False if the tool is unknown.
+        """
+        self.expire_prefetch()
+        if name not in self.tools:
+            return False
+        self.prefetchable.add(name)
+        key = self.call_key(name, arguments)
+        if key in self.prefetch_cache:
+            self._drop_prefetch(key)
+            self.prefetch_stats.wasted += 1
+        task = asyncio.create_task(self.tools[name].function(name, dict(arguments)))
+        self.prefetch_cache[key] = (time.monotonic() + ttl, task)
+        self.prefetch_stats.issued += 1
+        return True
+
+    def _take_prefetched(self, name: str, arguments: dict[str, Any]):
+        """Pop a live prefetched call matching this one, if any"""
+        self.expire_prefetch()
+        entry = self.prefetch_cache.pop(self.call_key(name, arguments), None)
+        if entry is None:
+            return None
+        self.prefetch_stats.hits += 1
+        return entry[1]
+
+    def _drop_prefetch(self, key: tuple):
+        """Remove a cache entry, cancelling the call if it is still running"""
+        _, task = self.prefetch_cache.pop(key)
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled():
+            # Retrieve the exception so asyncio doesn't log it as unhandled.
+            task.exception()
+
+    def expire_prefetch(self):
+        """Drop prefetched results past their TTL and count them as wasted"""
+        now = time.monotonic()
+        for key, (expires_at, _) in list(self.prefetch_cache.items()):
+            if expires_at <= now:
+                self._drop_prefetch(key)
+                self.prefetch_stats.wasted += 1
+
+    def invalidate_prefetch(self):
+        """Drop every prefetched result, e.g. after a tool changed the repo"""
+        for key in list(self.prefetch_cache):
+            self._drop_prefetch(key)
+            self.prefetch_stats.invalidated += 1
 
     def clear_tools(self):
         """Clear all registered tools"""
+        self.invalidate_prefetch()
         self.tools.clear()
@@ -0,0 +1,116 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from agent import CONTEXT_BUCKETS, PREFETCH_TOOLS, OllamaAgent
+from ollama_toolmanager import OllamaToolManager
+
+
+class TestOllamaAgentContextWindow:
+
+    def setup_method(self):
+        self.agent = OllamaAgent("model1:latest", OllamaToolManager(), "/tmp/repo")
+
+    def test_estimate_tokens_grows_with_messages(self):
+        messages = []
+        empty = self.agent.estimate_tokens(messages, [])
+        messages.append({'role': 'user', 'content': 'x' * 4000})
+        assert self.agent.estimate_tokens(messages, []) >= empty + 1000
+
+    def test_select_num_ctx_smallest_bucket(self):
+        assert self.agent.select_num_ctx(100) == (CONTEXT_BUCKETS[0], False)
+
+    def test_select_num_ctx_larger_bucket(self):
+        assert self.agent.select_num_ctx(CONTEXT_BUCKETS[0]) == (CONTEXT_BUCKETS[1], False)
+
+    def test_select_num_ctx_never_shrinks(self):
+        self.agent.select_num_ctx(CONTEXT_BUCKETS[1])
+        assert self.agent.select_num_ctx(10) == (CONTEXT_BUCKETS[2], False)
+
+    def test_select_num_ctx_reports_truncation(self):
+        assert self.agent.select_num_ctx(CONTEXT_BUCKETS[-1]) == (CONTEXT_BUCKETS[-1], True)
+
+    @pytest.mark.asyncio
+    async def test_get_response_passes_num_ctx(self):
+        self.agent.client.chat = AsyncMock()
+        async def handle_response(response, messages=None):
+            return "ok"
+        self.agent.handle_response = handle_response
+
+        result = await self.agent.get_response("show the git status")
+
+        assert result == "ok"
+        _, kwargs = self.agent.client.chat.call_args
+        assert kwargs['options'] == {'num_ctx': CONTEXT_BUCKETS[0]}
+
+    @pytest.mark.asyncio
+    async def test_get_response_warns_before_sending(self):
+        self.agent.client.chat = AsyncMock()
+        async def handle_response(response, messages=None):
+            return None
+        self.agent.handle_response = handle_response
+        self.agent.context_buckets = [CONTEXT_BUCKETS[0]]
+        warnings = []
+
+        def on_warning(message):
+            warnings.append((message, self.agent.client.chat.called))
+
+        result = await self.agent.get_response("x" * 4 * CONTEXT_BUCKETS[0], on_warning=on_warning)
+
+        assert result is None
+        assert len(warnings) == 1
+        message, chat_called = warnings[0]
+        assert message.startswith("Warning: prompt needs")
+        assert not chat_called
+
+    @pytest.mark.asyncio
+    async def test_get_response_no_warning_when_prompt_fits(self):
+        self.agent.client.chat = AsyncMock()
+        async def handle_response(response, messages=None):
+            return "ok"
+        self.agent.handle_response = handle_response
+        warnings = []
+
+        await self.agent.get_response("show the git status", on_warning=warnings.append)
+
+        assert warnings == []
+
+    @pytest.mark.asyncio
+    async def test_get_response_with_separate_history(self):
+        self.agent.client.chat = AsyncMock()
+        async def handle_response(response, messages=None):
+            return "ok"
+        self.agent.handle_response = handle_response
+
+        history = []
+        await self.agent.get_response("show the git log", messages=history)
+
+        assert self.agent.messages == []
+        assert history == [{'role': 'user', 'content': 'show the git log'}]
+
+
+class TestOllamaAgentPrefetch:
+
+    def setup_method(self):
+        self.tool_manager = OllamaToolManager()
+        self.agent = OllamaAgent("model1:latest", self.tool_manager, "/tmp/repo",
+                                 prefetch_tools=PREFETCH_TOOLS)
+
+    def test_prefetch_candidates_default(self):
+        assert self.agent.prefetch_candidates() == [
+            ("git_status", {'repo_path': "/tmp/repo"}),
+            ("git_log", {'repo_path': "/tmp/repo"}),
+        ]
+
+    def test_prefetch_candidates_from_history(self):
+        self.tool_manager.recent_calls.append(("git_log", {'repo_path': "/tmp/repo", 'max_count': 5}))
+        self.tool_manager.recent_calls.append(("git_commit", {'repo_path': "/tmp/repo", 'message': "x"}))
+
+        candidates = self.agent.prefetch_candidates()
+
+        assert ("git_log", {'repo_path': "/tmp/repo", 'max_count': 5}) in candidates
+        assert all(name in PREFETCH_TOOLS for name, _ in candidates)
+
+    def test_prefetch_disabled_by_default(self):
+        agent = OllamaAgent("model1:latest", self.tool_manager, "/tmp/repo")
+        assert agent.prefetch_candidates() == []
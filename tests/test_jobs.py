@@ -0,0 +1,156 @@
+import asyncio
+
+import pytest
+
+from jobs import JobManager
+
+
+class FakeAgent:
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.messages = []
+        self.histories = []
+
+    async def get_response(self, content, messages=None, on_warning=None):
+        self.histories.append(messages)
+        if content == "huge" and on_warning:
+            on_warning("Warning: prompt needs more tokens")
+        messages.append({'role': 'user', 'content': content})
+        await asyncio.sleep(self.delay)
+        if content == "boom":
+            raise ValueError("Test error")
+        return f"answer to {content}"
+
+
+class TestJobManager:
+
+    @pytest.mark.asyncio
+    async def test_submit_and_wait(self):
+        completed = []
+        jobs = JobManager(FakeAgent(), on_complete=completed.append)
+
+        job = jobs.submit("git status")
+        result = await jobs.wait(job.id)
+
+        assert result == "answer to git status"
+        assert job.status == "done"
+        assert completed == [job]
+
+    @pytest.mark.asyncio
+    async def test_jobs_run_concurrently_with_separate_histories(self):
+        agent = FakeAgent(delay=0.05)
+        jobs = JobManager(agent, max_concurrent=2)
+
+        first = jobs.submit("git status")
+        second = jobs.submit("git log")
+        await asyncio.sleep(0.01)
+
+        assert first.status == "running"
+        assert second.status == "running"
+        await jobs.wait(first.id)
+        await jobs.wait(second.id)
+        assert agent.histories[0] is not agent.histories[1]
+
+    @pytest.mark.asyncio
+    async def test_jobs_share_conversation_history(self):
+        agent = FakeAgent()
+        agent.messages.append({'role': 'user', 'content': 'earlier'})
+        jobs = JobManager(agent)
+
+        first = jobs.submit("git log")
+        await jobs.wait(first.id)
+        second = jobs.submit("show the diff of that commit")
+        await jobs.wait(second.id)
+
+        assert [m['content'] for m in agent.histories[1]] == [
+            'earlier', 'git log', 'show the diff of that commit'
+        ]
+        assert [m['content'] for m in agent.messages] == [
+            'earlier', 'git log', 'show the diff of that commit'
+        ]
+
+    @pytest.mark.asyncio
+    async def test_all_lists_every_job(self):
+        jobs = JobManager(FakeAgent())
+
+        first = jobs.submit("git status")
+        await jobs.wait(first.id)
+        second = jobs.submit("git log")
+
+        assert jobs.all() == [first, second]
+        assert jobs.active() == [second]
+        await jobs.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_max_concurrent_queues_extra_jobs(self):
+        jobs = JobManager(FakeAgent(delay=0.05), max_concurrent=1)
+
+        first = jobs.submit("git status")
+        second = jobs.submit("git log")
+        await asyncio.sleep(0.01)
+
+        assert first.status == "running"
+        assert second.status == "queued"
+        await jobs.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_submit_rejects_when_full(self):
+        jobs = JobManager(FakeAgent(delay=0.05), max_active=1)
+
+        jobs.submit("git status")
+        with pytest.raises(RuntimeError, match="Too many jobs in flight"):
+            jobs.submit("git log")
+        await jobs.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancel(self):
+        jobs = JobManager(FakeAgent(delay=1))
+
+        job = jobs.submit("git status")
+        await asyncio.sleep(0)
+
+        assert jobs.cancel(job.id)
+        await jobs.wait(job.id)
+        assert job.status == "cancelled"
+        assert not jobs.cancel(job.id)
+        assert not jobs.cancel(42)
+
+    @pytest.mark.asyncio
+    async def test_cancel_before_start_frees_the_slot(self):
+        jobs = JobManager(FakeAgent(), max_active=1)
+
+        job = jobs.submit("git status")
+        assert jobs.cancel(job.id)
+        await jobs.wait(job.id)
+
+        assert job.status == "cancelled"
+        assert jobs.active() == []
+        next_job = jobs.submit("git log")
+        assert await jobs.wait(next_job.id) == "answer to git log"
+
+    @pytest.mark.asyncio
+    async def test_failed_job(self):
+        jobs = JobManager(FakeAgent())
+
+        job = jobs.submit("boom")
+        result = await jobs.wait(job.id)
+
+        assert job.status == "failed"
+        assert "Test error" in result
+
+    @pytest.mark.asyncio
+    async def test_warnings_identify_the_job(self):
+        warnings = []
+        jobs = JobManager(FakeAgent(), on_warning=lambda job, message: warnings.append((job.id, message)))
+
+        job = jobs.submit("huge")
+        await jobs.wait(job.id)
+
+        assert warnings == [(job.id, "Warning: prompt needs more tokens")]
+
+    @pytest.mark.asyncio
+    async def test_wait_unknown_job(self):
+        jobs = JobManager(FakeAgent())
+
+        with pytest.raises(ValueError, match="Unknown job: 7"):
+            await jobs.wait(7)
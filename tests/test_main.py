@@ -1,6 +1,6 @@
 import sys
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 # Mock the 'mcp' package and its submodules to prevent ImportError
 # This is because mcpclient.py (imported by main.py) imports from 'mcp'
@@ -126,5 +126,135 @@ class TestMainModelSelection(unittest.TestCase):
         MockConsole.return_value.ask.assert_not_called()
 
 
+
+class TestReplCommands(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.console = MagicMock()
+        self.jobs = MagicMock()
+        self.jobs.jobs = {}
+        self.jobs.all.return_value = []
+        self.jobs.wait = AsyncMock()
+
+    def make_job(self, job_id, status, result=None, done=True):
+        job = main.Job(job_id, f"prompt {job_id}", status=status, result=result)
+        job.task = MagicMock()
+        job.task.done.return_value = done
+        self.jobs.jobs[job_id] = job
+        return job
+
+    async def test_submit_prompt(self):
+        self.jobs.submit.return_value = main.Job(1, "git status")
+
+        await main.handle_command(self.console, self.jobs, "git status")
+
+        self.jobs.submit.assert_called_once_with("git status")
+        self.console.print.assert_any_call("Submitted job 1.")
+
+    async def test_submit_on_full_queue(self):
+        self.jobs.submit.side_effect = RuntimeError("Too many jobs in flight (8 queued or running)")
+
+        await main.handle_command(self.console, self.jobs, "git status")
+
+        self.console.print.assert_called_once_with(
+            "[prompt.invalid]Too many jobs in flight (8 queued or running). Wait for a job to finish or cancel one.")
+
+    async def test_jobs_lists_status(self):
+        job = self.make_job(1, "running", done=False)
+        self.jobs.all.return_value = [job]
+
+        await main.handle_command(self.console, self.jobs, "/jobs")
+
+        self.console.print.assert_called_once_with("[1] running   prompt 1")
+
+    async def test_jobs_when_empty(self):
+        await main.handle_command(self.console, self.jobs, "/jobs")
+
+        self.console.print.assert_called_once_with("No jobs submitted yet.")
+
+    async def test_stats(self):
+        self.jobs.agent.tool_manager.prefetch_stats = "prefetch: 0 issued"
+
+        await main.handle_command(self.console, self.jobs, "/stats")
+
+        self.console.print.assert_called_once_with("prefetch: 0 issued")
+
+    async def test_wait_and_cancel_require_numeric_id(self):
+        for command in ("/wait", "/cancel"):
+            self.console.reset_mock()
+            await main.handle_command(self.console, self.jobs, f"{command} abc")
+            self.console.print.assert_called_once_with(f"[prompt.invalid]Usage: {command} <job id>")
+        self.jobs.wait.assert_not_called()
+        self.jobs.cancel.assert_not_called()
+
+    async def test_wait_and_cancel_unknown_id(self):
+        for command in ("/wait", "/cancel"):
+            self.console.reset_mock()
+            await main.handle_command(self.console, self.jobs, f"{command} 7")
+            self.console.print.assert_called_once_with("[prompt.invalid]Unknown job: 7")
+        self.jobs.wait.assert_not_called()
+        self.jobs.cancel.assert_not_called()
+
+    async def test_cancel(self):
+        self.make_job(1, "running", done=False)
+        self.jobs.cancel.return_value = True
+
+        await main.handle_command(self.console, self.jobs, "/cancel 1")
+
+        self.jobs.cancel.assert_called_once_with(1)
+        self.console.print.assert_called_once_with("Cancelled job 1.")
+
+    async def test_cancel_finished_job(self):
+        self.make_job(1, "done", result="ok")
+        self.jobs.cancel.return_value = False
+
+        await main.handle_command(self.console, self.jobs, "/cancel 1")
+
+        self.console.print.assert_called_once_with("[prompt.invalid]Job 1 is not running.")
+
+    async def test_wait_on_finished_job_prints_result(self):
+        self.make_job(1, "done", result="ok")
+
+        await main.handle_command(self.console, self.jobs, "/wait 1")
+
+        self.jobs.wait.assert_not_called()
+        self.console.print.assert_any_call("\n[bold magenta]Result of job 1 (done):[/bold magenta] prompt 1")
+        self.assertEqual(self.console.print.call_count, 2)
+
+    async def test_wait_on_running_job(self):
+        job = self.make_job(1, "running", done=False)
+
+        async def finish(job_id):
+            job.status = "done"
+        self.jobs.wait.side_effect = finish
+
+        await main.handle_command(self.console, self.jobs, "/wait 1")
+
+        self.jobs.wait.assert_awaited_once_with(1)
+        # The result is printed by on_complete, not by /wait
+        self.console.print.assert_not_called()
+
+    async def test_wait_on_cancelled_job_reports_status(self):
+        self.make_job(1, "cancelled")
+
+        await main.handle_command(self.console, self.jobs, "/wait 1")
+
+        self.console.print.assert_called_once_with(
+            "\n[bold magenta]Result of job 1 (cancelled):[/bold magenta] prompt 1")
+
+
+class TestReadInput(unittest.IsolatedAsyncioTestCase):
+
+    @patch('builtins.input', return_value="git status")
+    async def test_read_input(self, mock_input):
+        self.assertEqual(await main.read_input("> "), "git status")
+        mock_input.assert_called_once_with("> ")
+
+    @patch('builtins.input', side_effect=EOFError)
+    async def test_read_input_eof(self, mock_input):
+        with self.assertRaises(EOFError):
+            await main.read_input("> ")
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -269,6 +269,131 @@ class TestOllamaToolManager:
         assert result["status"] == "success"
         assert result["content"][0]["text"] == "Git tool executed"
         
+    @pytest.mark.asyncio
+    @patch('builtins.print')
+    async def test_execute_tool_uses_prefetched_result(self, mock_print):
+        calls = []
+
+        async def git_status(name: str, args: dict) -> dict:
+            calls.append(args)
+            return {'tool': name, 'content': [{'text': "clean"}], 'status': 'success'}
+
+        self.tool_manager.register_tool(
+            name="git_status",
+            function=git_status,
+            description="Show the working tree status",
+            inputSchema={"properties": {"repo_path": {"type": "string"}}, "required": ["repo_path"]}
+        )
+
+        assert self.tool_manager.prefetch("git_status", {"repo_path": "/tmp/repo"})
+
+        mock_function = MagicMock()
+        mock_function.name = "git_status"
+        mock_function.arguments = {}
+
+        result = await self.tool_manager.execute_tool({"function": mock_function}, "/tmp/repo")
+
+        assert result["content"][0]["text"] == "clean"
+        assert len(calls) == 1
+        assert self.tool_manager.prefetch_stats.issued == 1
+        assert self.tool_manager.prefetch_stats.hits == 1
+        assert self.tool_manager.prefetch_cache == {}
+        assert self.tool_manager.recent_calls[-1] == ("git_status", {"repo_path": "/tmp/repo"})
+
+    @pytest.mark.asyncio
+    async def test_expired_prefetch_is_wasted(self):
+        self.tool_manager.register_tool(
+            name="multiply",
+            function=async_multiply,
+            description="Multiply two numbers asynchronously",
+            inputSchema={"properties": {}, "required": []}
+        )
+
+        assert self.tool_manager.prefetch("multiply", {"a": 2, "b": 3}, ttl=0)
+        await asyncio.sleep(0)
+        self.tool_manager.expire_prefetch()
+
+        assert self.tool_manager.prefetch_cache == {}
+        assert self.tool_manager.prefetch_stats.wasted == 1
+        assert self.tool_manager.prefetch_stats.hits == 0
+
+    @pytest.mark.asyncio
+    @patch('builtins.print')
+    async def test_write_tool_invalidates_prefetched_results(self, mock_print):
+        repo = {'status': "dirty"}
+
+        async def git_status(name: str, args: dict) -> dict:
+            return {'tool': name, 'content': [{'text': repo['status']}], 'status': 'success'}
+
+        async def git_commit(name: str, args: dict) -> dict:
+            repo['status'] = "clean"
+            return {'tool': name, 'content': [{'text': "committed"}], 'status': 'success'}
+
+        schema = {"properties": {"repo_path": {"type": "string"}}, "required": ["repo_path"]}
+        self.tool_manager.register_tool("git_status", git_status, "Show the working tree status", schema)
+        self.tool_manager.register_tool("git_commit", git_commit, "Record changes", schema)
+
+        def payload(name):
+            mock_function = MagicMock()
+            mock_function.name = name
+            mock_function.arguments = {}
+            return {"function": mock_function}
+
+        self.tool_manager.prefetch("git_status", {"repo_path": "/tmp/repo"})
+        await asyncio.sleep(0)
+        await self.tool_manager.execute_tool(payload("git_commit"), "/tmp/repo")
+
+        assert self.tool_manager.prefetch_cache == {}
+        result = await self.tool_manager.execute_tool(payload("git_status"), "/tmp/repo")
+        assert result["content"][0]["text"] == "clean"
+        assert self.tool_manager.prefetch_stats.hits == 0
+        assert self.tool_manager.prefetch_stats.invalidated == 1
+        assert self.tool_manager.prefetch_stats.wasted == 0
+
+    @pytest.mark.asyncio
+    async def test_prefetch_replaces_existing_entry(self):
+        responses = iter(["dirty", "clean"])
+
+        async def git_status(name: str, args: dict) -> dict:
+            return {'tool': name, 'content': [{'text': next(responses)}], 'status': 'success'}
+
+        self.tool_manager.register_tool(
+            name="git_status",
+            function=git_status,
+            description="Show the working tree status",
+            inputSchema={"properties": {}, "required": []}
+        )
+
+        assert self.tool_manager.prefetch("git_status", {"repo_path": "/tmp/repo"})
+        await asyncio.sleep(0)
+        assert self.tool_manager.prefetch("git_status", {"repo_path": "/tmp/repo"})
+
+        (_, task), = self.tool_manager.prefetch_cache.values()
+        result = await task
+        assert result["content"][0]["text"] == "clean"
+        assert self.tool_manager.prefetch_stats.issued == 2
+        assert self.tool_manager.prefetch_stats.wasted == 1
+
+    @pytest.mark.asyncio
+    async def test_clear_tools_counts_invalidated_not_wasted(self):
+        self.tool_manager.register_tool(
+            name="multiply",
+            function=async_multiply,
+            description="Multiply two numbers asynchronously",
+            inputSchema={"properties": {}, "required": []}
+        )
+
+        self.tool_manager.prefetch("multiply", {"a": 2, "b": 3})
+        self.tool_manager.clear_tools()
+
+        assert self.tool_manager.prefetch_cache == {}
+        assert self.tool_manager.prefetch_stats.invalidated == 1
+        assert self.tool_manager.prefetch_stats.wasted == 0
+
+    def test_prefetch_unknown_tool(self):
+        assert not self.tool_manager.prefetch("unknown_tool", {})
+        assert self.tool_manager.prefetch_stats.issued == 0
+
     def test_clear_tools(self):
         # Add a tool
         inputSchema = {